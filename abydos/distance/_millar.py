@@ -19,13 +19,37 @@
 Millar's binomial deviance dissimilarity
 """
 
+from functools import lru_cache
 from math import log
-from typing import Any, NoReturn
+from typing import Any, Counter as TCounter, Dict, NoReturn, Union
 
 from ._token_distance import _TokenDistance
 
 __all__ = ['Millar']
 
+_LOG2 = 0.6931471805599453
+
+
+@lru_cache(maxsize=1024)
+def _log(n: Union[int, float]) -> float:
+    """Return the (memoized) natural log of a token count.
+
+    Parameters
+    ----------
+    n : int or float
+        A token count
+
+    Returns
+    -------
+    float
+        The natural log of n
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return log(n)
+
 
 class Millar(_TokenDistance):
     r"""Millar's binomial deviance dissimilarity.
@@ -57,6 +81,54 @@ class Millar(_TokenDistance):
         """
         super(Millar, self).__init__(**kwargs)
 
+        self._tokenize_cached = lru_cache(maxsize=4096)(self._tokenize_str)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the instance state for pickling, without the token cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_tokenize_cached']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance state and rebuild the token cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._tokenize_cached = lru_cache(maxsize=4096)(self._tokenize_str)
+
+    def _tokenize_str(self, word: str) -> TCounter[str]:
+        """Return the token Counter of a single string.
+
+        This is wrapped in a bounded LRU cache per instance, so that repeated
+        strings (e.g. a fixed src compared against many tar values) are only
+        tokenized once. The returned Counters are shared and must not be
+        modified.
+
+        Parameters
+        ----------
+        word : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The tokens of word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counter = (
+            self.params['tokenizer'].tokenize(word).get_counter()
+        )  # type: TCounter[str]
+        return counter
+
     def dist_abs(self, src: str, tar: str) -> float:
         """Return Millar's binomial deviance dissimilarity of two strings.
 
@@ -88,26 +160,37 @@ class Millar(_TokenDistance):
         .. versionadded:: 0.4.1
 
         """
-        self._tokenize(src, tar)
+        self._tokenize(
+            self._tokenize_cached(src) if isinstance(src, str) else src,
+            self._tokenize_cached(tar) if isinstance(tar, str) else tar,
+        )
 
         src_tok = self._src_tokens
         tar_tok = self._tar_tokens
-        alphabet = set(src_tok.keys() | tar_tok.keys())
+        memo_log = _log
+
+        # A token found in only one of the sets contributes
+        # (0 + 0 + n_k*log(2))/n_k = log(2), so only the tokens in common
+        # need their terms computed. (Fully disjoint sets thus score
+        # |S|*log(2), without a single log call.)
+        common = src_tok.keys() & tar_tok.keys()
+        score = (len(src_tok) + len(tar_tok) - 2 * len(common)) * _LOG2
 
-        log2 = log(2)
-        score = 0.0
-        for tok in alphabet:
-            n_k = src_tok[tok] + tar_tok[tok]
+        for tok in common:
+            s = src_tok[tok]
+            t = tar_tok[tok]
+            n_k = s + t
+            log_n_k = memo_log(n_k)
 
             src_val = 0.0
-            if src_tok[tok]:
-                src_val = src_tok[tok] * log(src_tok[tok] / n_k)
+            if s:
+                src_val = s * (memo_log(s) - log_n_k)
 
             tar_val = 0.0
-            if tar_tok[tok]:
-                tar_val = tar_tok[tok] * log(tar_tok[tok] / n_k)
+            if t:
+                tar_val = t * (memo_log(t) - log_n_k)
 
-            score += (src_val + tar_val + n_k * log2) / n_k
+            score += (src_val + tar_val + n_k * _LOG2) / n_k
 
         if score > 0:
             return score
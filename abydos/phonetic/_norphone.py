@@ -19,6 +19,10 @@
 Norphone
 """
 
+import re
+from functools import lru_cache
+from typing import Match
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Norphone']
@@ -61,6 +65,24 @@ class Norphone(_Phonetic):
         },
         1: {'W': 'V', 'X': 'KS', 'Z': 'S', 'D': 'T', 'G': 'K'},
     }
+    # (length, replacements) pairs, longest first
+    _replacements_by_length = tuple(
+        sorted(_replacements.items(), reverse=True)
+    )
+    # Non-initial vowels are deleted; all other characters not covered by a
+    # replacement are kept. Alternatives are ordered longest first.
+    _replacements_re = re.compile(
+        '|'.join(key for _, repl in _replacements_by_length for key in repl)
+        + '|['
+        + ''.join(sorted(_uc_v_set))
+        + ']'
+    )
+    _replacements_map = {
+        key: val
+        for _, repl in _replacements_by_length
+        for key, val in repl.items()
+    }
+    _replacements_map.update(dict.fromkeys(_uc_v_set, ''))
 
     def encode(self, word: str) -> str:
         """Return the Norphone code.
@@ -93,6 +115,48 @@ class Norphone(_Phonetic):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Results are cached
+
+        """
+        return self._encode_cached(word)
+
+    @classmethod
+    @lru_cache(maxsize=16384)
+    def _encode_cached(cls, word: str) -> str:
+        """Return the Norphone code, from a class-level cache.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        str
+            The Norphone code
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return cls()._encode(word)
+
+    def _encode(self, word: str) -> str:
+        """Return the Norphone code, without caching.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        str
+            The Norphone code
+
+
+        .. versionadded:: 0.6.0
 
         """
         word = word.upper()
@@ -132,25 +196,36 @@ class Norphone(_Phonetic):
         elif word[-2:-1] in self._uc_v_set and word[-1:] == 'D':
             word = word[:-2]
 
-        for pos, char in enumerate(word):
-            if skip:
-                skip -= 1
-            else:
-                for length in sorted(self._replacements, reverse=True):
-                    if word[pos : pos + length] in self._replacements[length]:
-                        code += self._replacements[length][
-                            word[pos : pos + length]
-                        ]
-                        skip = length - 1
-                        break
-                else:
-                    if not pos or char not in self._uc_v_set:
-                        code += char
+        if not skip and word[:1] in self._uc_v_set:
+            # an initial vowel is kept
+            code = word[:1]
+            skip = 1
+
+        code += self._replacements_re.sub(self._replacement, word[skip:])
 
         code = self._delete_consecutive_repeats(code)
 
         return code
 
+    def _replacement(self, match: Match[str]) -> str:
+        """Return the replacement for a match of the replacements pattern.
+
+        Parameters
+        ----------
+        match : Match
+            A match of _replacements_re
+
+        Returns
+        -------
+        str
+            The replacement string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._replacements_map[match.group(0)]
+
 
 if __name__ == '__main__':
     import doctest
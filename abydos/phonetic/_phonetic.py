@@ -67,7 +67,11 @@ class _Phonetic:
             Encapsulated in class
 
         """
-        return ''.join(char for char, _ in groupby(word))
+        if len(word) < 2:
+            return word
+        # joining a list is faster than joining a generator, since join
+        # would otherwise build the list itself
+        return ''.join([char for char, _ in groupby(word)])
 
     def encode(self, word: str) -> str:
         """Encode phonetically.
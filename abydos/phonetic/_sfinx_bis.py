@@ -19,6 +19,9 @@
 SfinxBis
 """
 
+import re
+from functools import lru_cache
+from typing import Iterable, List, Match
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -71,9 +74,18 @@ class SfinxBis(_Phonetic):
         ' Y ',
         ' S:T ',
     )
+    # ' VAN DE ' is omitted since ' VAN ' and ' DE ' already cover it, and
+    # matching it would prevent ' DE LAS ' & ' DE LOS ' from matching, which
+    # take precedence in the reference implementation.
+    _adelstitler_re = re.compile(
+        ' (?:'
+        + '|'.join(re.escape(_[1:-1]) for _ in _adelstitler if _ != ' VAN DE ')
+        + ')(?= )'
+    )
 
     _harde_vokaler = {'A', 'O', 'U', 'Å'}
     _mjuka_vokaler = {'E', 'I', 'Y', 'Ä', 'Ö'}
+    _vokaler = frozenset(_harde_vokaler | _mjuka_vokaler)
     _uc_c_set = {
         'B',
         'C',
@@ -127,6 +139,15 @@ class SfinxBis(_Phonetic):
         'Å',
         'Ö',
     }
+    _non_uc_re = re.compile('[^' + ''.join(sorted(_uc_set)) + ']')
+
+    # Steg 8 & 9 rewrites, applied in one pass: DT->T, X->KS, and C before a
+    # soft vowel->8 (the trailing '9' removal of Steg 11 cannot be folded
+    # into _trans, since the 9s separate repeats in Steg 10)
+    _rest_re = re.compile(
+        'DT|X|C(?=[' + ''.join(sorted(_mjuka_vokaler)) + '])'
+    )
+    _rest_map = {'DT': 'T', 'X': 'KS', 'C': '8'}
 
     _trans = dict(
         zip(
@@ -142,6 +163,74 @@ class SfinxBis(_Phonetic):
         )
     )
 
+    # Försvenskning, applied in a single left-to-right pass. The patterns
+    # reproduce the effect of the reference implementation's sequence of
+    # replacements: STIERN->STJÄRN, HIE->HJ, SIÖ->SJÖ, SCH->SH, QU->KV,
+    # IO->JO, PH->F, vowel+[ÜYI]->vowel+J, and H+consonant->consonant.
+    # Lookarounds (which see the unmodified word) cover the cases where one
+    # of these replacements feeds another.
+    _foersvensk_re = re.compile(
+        'STIERN|PHIE|PH|HIE|HI(?=O)|H(?=[BCDFGHJKLMNPQRSTVWXZ])|SC(?=H)|QU'
+        '|[AOUÅEIYÄÖ][ÜYI]|I(?=O)|(?<=S)I(?=Ö)'
+    )
+    _foersvensk_map = {
+        'STIERN': 'STJÄRN',
+        'PHIE': 'FJ',
+        'PH': 'F',
+        'HIE': 'J',
+        'HI': 'J',
+        'H': '',
+        'SC': 'S',
+        'QU': 'KV',
+        'I': 'J',
+    }
+    _foersvensk_map.update(
+        {v + c: v + 'J' for v in 'AOUÅEIYÄÖ' for c in 'ÜYI'}
+    )
+    _foersvensk_subst = dict(_substitutions)
+    _foersvensk_subst.update({ord('Ð'): 'ETH', ord('Þ'): 'TH'})
+
+    # Koda första ljudet: (length, {prefix: (replacement, chars replaced)})
+    # pairs, longest first. Trying the longest prefix first gives the same
+    # result as the reference implementation's ordered rules.
+    _foersta_ljudet = (
+        (
+            3,
+            dict(
+                {'SKJ': ('#', 3), 'STJ': ('#', 3), 'SCH': ('#', 3)},
+                **{'CH' + _: ('#', 2) for _ in _vokaler},
+                **{'SK' + _: ('#', 2) for _ in _mjuka_vokaler}
+            ),
+        ),
+        (
+            2,
+            dict(
+                {
+                    'DJ': ('J', 2),
+                    'GJ': ('J', 2),
+                    'HJ': ('J', 2),
+                    'LJ': ('J', 2),
+                    'SH': ('#', 2),
+                    'KJ': ('#', 2),
+                    'TJ': ('#', 2),
+                    'SJ': ('#', 2),
+                },
+                **{'G' + _: ('J', 1) for _ in _mjuka_vokaler},
+                **{'C' + _: ('K', 1) for _ in _harde_vokaler},
+                **{'C' + _: ('K', 1) for _ in _uc_c_set},
+                **{'C' + _: ('S', 1) for _ in _mjuka_vokaler},
+                **{'K' + _: ('#', 1) for _ in _mjuka_vokaler}
+            ),
+        ),
+        (
+            1,
+            dict(
+                {'Q': ('K', 1), 'X': ('S', 1)},
+                **{_: ('$', 1) for _ in _vokaler}
+            ),
+        ),
+    )
+
     _alphabetic = dict(zip((ord(_) for _ in '123456789#'), 'PKTLNRFSAŠ'))
 
     def __init__(self, max_length: int = -1) -> None:
@@ -157,6 +246,76 @@ class SfinxBis(_Phonetic):
 
         """
         self._max_length = max_length
+        # the truncation applied to each token's code, resolved once here so
+        # that encoding doesn't have to branch on max_length
+        self._truncate = slice(max_length if max_length > 0 else None)
+
+    def _foersvensker(self, lokal_ordet: str) -> str:
+        """Return the Swedish-ized form of the word.
+
+        Parameters
+        ----------
+        lokal_ordet : str
+            Word to transform
+
+        Returns
+        -------
+        str
+            Transformed word
+
+
+        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.6.0
+            Moved out of encode
+
+        """
+        return self._foersvensk_re.sub(
+            self._foersvensk_replacement, lokal_ordet
+        ).translate(self._foersvensk_subst)
+
+    def _foersvensk_replacement(self, match: Match[str]) -> str:
+        """Return the replacement for a match of the försvenskning pattern.
+
+        Parameters
+        ----------
+        match : Match
+            A match of _foersvensk_re
+
+        Returns
+        -------
+        str
+            The replacement string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._foersvensk_map[match.group(0)]
+
+    def _koda_foersta_ljudet(self, lokal_ordet: str) -> str:
+        """Return the word with the first sound coded.
+
+        Parameters
+        ----------
+        lokal_ordet : str
+            Word to transform
+
+        Returns
+        -------
+        str
+            Transformed word
+
+
+        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.6.0
+            Moved out of encode
+
+        """
+        for length, prefixes in self._foersta_ljudet:
+            kod = prefixes.get(lokal_ordet[:length])
+            if kod is not None:
+                return kod[0] + lokal_ordet[kod[1] :]
+        return lokal_ordet
 
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic SfinxBis code for a word.
@@ -231,182 +390,159 @@ class SfinxBis(_Phonetic):
         .. versionchanged:: 0.3.6
             Encapsulated in class
         .. versionchanged:: 0.6.0
-            Made return a str only (comma-separated)
+            Made return a str only (comma-separated) & results are cached
+
+        """
+        return self._encode_cached(word, self._max_length)
+
+    # keyed on max_length, so that one cache serves every instance and none
+    # is stored on (or pickled with) the instance
+    @classmethod
+    @lru_cache(maxsize=16384)
+    def _encode_cached(cls, word: str, max_length: int) -> str:
+        """Return the SfinxBis code for a word, from a class-level cache.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+        max_length : int
+            The length of the code returned
+
+        Returns
+        -------
+        str
+            The SfinxBis value
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return cls(max_length)._encode(word)
+
+    def encode_batch(self, words: Iterable[str]) -> List[str]:
+        """Return the SfinxBis codes for a collection of words.
+
+        Each distinct word in the batch is encoded only once, which suits
+        encoding a column of names with many repeated values. The batch does
+        not pass through (and so does not evict entries from) the cache used
+        by :py:meth:`encode`.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to transform
+
+        Returns
+        -------
+        list of str
+            The SfinxBis values, in the same order as words
+
+        Examples
+        --------
+        >>> pe = SfinxBis()
+        >>> pe.encode_batch(['Johansson', 'Sjöberg', 'Johansson'])
+        ['J585', '#162', 'J585']
+
+
+        .. versionadded:: 0.6.0
 
         """
+        words = list(words)
+        codes = {word: self._encode(word) for word in set(words)}
+        return [codes[word] for word in words]
+
+    def _encode(self, word: str) -> str:
+        """Return the SfinxBis code for a word, without caching.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        str
+            The SfinxBis value
 
-        def _foersvensker(lokal_ordet: str) -> str:
-            """Return the Swedish-ized form of the word.
-
-            Parameters
-            ----------
-            lokal_ordet : str
-                Word to transform
-
-            Returns
-            -------
-            str
-                Transformed word
-
-            .. versionadded:: 0.1.0
-
-            """
-            lokal_ordet = lokal_ordet.replace('STIERN', 'STJÄRN')
-            lokal_ordet = lokal_ordet.replace('HIE', 'HJ')
-            lokal_ordet = lokal_ordet.replace('SIÖ', 'SJÖ')
-            lokal_ordet = lokal_ordet.replace('SCH', 'SH')
-            lokal_ordet = lokal_ordet.replace('QU', 'KV')
-            lokal_ordet = lokal_ordet.replace('IO', 'JO')
-            lokal_ordet = lokal_ordet.replace('PH', 'F')
-
-            for i in self._harde_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-            for i in self._mjuka_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-
-            if 'H' in lokal_ordet:
-                for i in self._uc_c_set:
-                    lokal_ordet = lokal_ordet.replace('H' + i, i)
-
-            lokal_ordet = lokal_ordet.translate(self._substitutions)
-
-            lokal_ordet = lokal_ordet.replace('Ð', 'ETH')
-            lokal_ordet = lokal_ordet.replace('Þ', 'TH')
-
-            return lokal_ordet
-
-        def _koda_foersta_ljudet(lokal_ordet: str) -> str:
-            """Return the word with the first sound coded.
-
-            Parameters
-            ----------
-            lokal_ordet : str
-                Word to transform
-
-            Returns
-            -------
-            str
-                Transformed word
-
-            .. versionadded:: 0.1.0
-
-            """
-            if (
-                lokal_ordet[0:1] in self._mjuka_vokaler
-                or lokal_ordet[0:1] in self._harde_vokaler
-            ):
-                lokal_ordet = '$' + lokal_ordet[1:]
-            elif lokal_ordet[0:2] in ('DJ', 'GJ', 'HJ', 'LJ'):
-                lokal_ordet = 'J' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'G'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = 'J' + lokal_ordet[1:]
-            elif lokal_ordet[0:1] == 'Q':
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif lokal_ordet[0:2] == 'CH' and lokal_ordet[2:3] in frozenset(
-                self._mjuka_vokaler | self._harde_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'C'
-                and lokal_ordet[1:2] in self._harde_vokaler
-            ):
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif (
-                lokal_ordet[0:1] == 'C' and lokal_ordet[1:2] in self._uc_c_set
-            ):
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif lokal_ordet[0:1] == 'X':
-                lokal_ordet = 'S' + lokal_ordet[1:]
-            elif (
-                lokal_ordet[0:1] == 'C'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = 'S' + lokal_ordet[1:]
-            elif lokal_ordet[0:3] in ('SKJ', 'STJ', 'SCH'):
-                lokal_ordet = '#' + lokal_ordet[3:]
-            elif lokal_ordet[0:2] in ('SH', 'KJ', 'TJ', 'SJ'):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:2] == 'SK'
-                and lokal_ordet[2:3] in self._mjuka_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'K'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[1:]
-            return lokal_ordet
 
+        .. versionadded:: 0.6.0
+
+        """
         # Steg 1, Versaler
         word = unicode_normalize('NFC', word.upper())
         word = word.replace('-', ' ')
 
         # Steg 2, Ta bort adelsprefix
-        for adelstitel in self._adelstitler:
-            while adelstitel in word:
-                word = word.replace(adelstitel, ' ')
-            if word.startswith(adelstitel[1:]):
-                word = word[len(adelstitel) - 1 :]
+        word = self._adelstitler_re.sub(' ', ' ' + word)
 
-        # Split word into tokens
-        ordlista = word.split()
+        # Steg 3-12 are applied to each token in turn
+        return ','.join([self._koda_ordet(ordet) for ordet in word.split()])
+
+    def _koda_ordet(self, ordet: str) -> str:
+        """Return the SfinxBis code for a single token of a name.
+
+        Parameters
+        ----------
+        ordet : str
+            An upper-cased token, with nobility prefixes already removed
 
+        Returns
+        -------
+        str
+            The SfinxBis value of the token
+
+
+        .. versionadded:: 0.6.0
+
+        """
         # Steg 3, Ta bort dubbelteckning i början på namnet
-        ordlista = [
-            self._delete_consecutive_repeats(ordet) for ordet in ordlista
-        ]
-        if not ordlista:
-            # noinspection PyRedundantParentheses
-            return ''
+        ordet = self._delete_consecutive_repeats(ordet)
 
         # Steg 4, Försvenskning
-        ordlista = [_foersvensker(ordet) for ordet in ordlista]
+        ordet = self._foersvensker(ordet)
 
         # Steg 5, Ta bort alla tecken som inte är A-Ö (65-90,196,197,214)
-        ordlista = [
-            ''.join(c for c in ordet if c in self._uc_set)
-            for ordet in ordlista
-        ]
+        ordet = self._non_uc_re.sub('', ordet)
 
         # Steg 6, Koda första ljudet
-        ordlista = [_koda_foersta_ljudet(ordet) for ordet in ordlista]
+        ordet = self._koda_foersta_ljudet(ordet)
 
         # Steg 7, Dela upp namnet i två delar
-        rest = [ordet[1:] for ordet in ordlista]
-
         # Steg 8, Utför fonetisk transformation i resten
-        rest = [ordet.replace('DT', 'T') for ordet in rest]
-        rest = [ordet.replace('X', 'KS') for ordet in rest]
-
         # Steg 9, Koda resten till en sifferkod
-        for vokal in self._mjuka_vokaler:
-            rest = [ordet.replace('C' + vokal, '8' + vokal) for ordet in rest]
-        rest = [ordet.translate(self._trans) for ordet in rest]
+        rest = self._rest_re.sub(self._rest_replacement, ordet[1:]).translate(
+            self._trans
+        )
 
         # Steg 10, Ta bort intilliggande dubbletter
-        rest = [self._delete_consecutive_repeats(ordet) for ordet in rest]
-
         # Steg 11, Ta bort alla "9"
-        rest = [ordet.replace('9', '') for ordet in rest]
+        rest = self._delete_consecutive_repeats(rest).replace('9', '')
 
         # Steg 12, Sätt ihop delarna igen
-        ordlista = [
-            ''.join(ordet) for ordet in zip((_[0:1] for _ in ordlista), rest)
-        ]
+        ordet = ordet[0:1] + rest
 
         # truncate, if max_length is set
-        if self._max_length > 0:
-            ordlista = [ordet[: self._max_length] for ordet in ordlista]
+        return ordet[self._truncate]
+
+    def _rest_replacement(self, match: Match[str]) -> str:
+        """Return the replacement for a match of the Steg 8 & 9 pattern.
+
+        Parameters
+        ----------
+        match : Match
+            A match of _rest_re
 
-        return ','.join(ordlista)
+        Returns
+        -------
+        str
+            The replacement string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._rest_map[match.group(0)]
 
 
 if __name__ == '__main__':
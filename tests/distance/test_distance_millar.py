@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.Millar
 """
 
+import pickle  # noqa: S403
 import unittest
 
 from abydos.distance import Millar
@@ -59,6 +60,12 @@ class MillarTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 4.852030263919617
         )
 
+        # instances survive pickling, and repeated strings score the same
+        cmp = pickle.loads(pickle.dumps(Millar()))  # noqa: S301
+        self.assertEqual(cmp.dist_abs('Niall', 'Neil'), 4.852030263919617)
+        self.assertEqual(cmp.dist_abs('Niall', 'Neil'), 4.852030263919617)
+        self.assertEqual(cmp.dist_abs('Niall', 'Nigel'), 4.1588830833596715)
+
     def test_millar_dist(self):
         """Test abydos.distance.Millar.dist."""
         self.assertRaises(NotImplementedError, self.cmp.dist)
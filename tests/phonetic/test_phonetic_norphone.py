@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.phonetic.Norphone
 """
 
+import pickle  # noqa: S403
 import unittest
 
 from abydos.phonetic import Norphone
@@ -86,6 +87,16 @@ class NorphoneTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('eit'), 'ÆT')
         self.assertEqual(self.pa.encode('Öl'), 'ØL')
 
+        # repeats produced across replacement boundaries
+        self.assertEqual(self.pa.encode('Axsel'), 'AKSL')
+        self.assertEqual(self.pa.encode('Wwang'), 'VNK')
+        self.assertEqual(self.pa.encode('Bockkjær'), 'BKXR')
+
+        # instances survive pickling, and repeated words encode the same
+        pa = pickle.loads(pickle.dumps(Norphone()))  # noqa: S301
+        self.assertEqual(pa.encode('Hansen'), 'HNSN')
+        self.assertEqual(pa.encode('Hansen'), 'HNSN')
+
         # test cases by larsga (the algorithm's author) posted to Reddit
         # https://www.reddit.com/r/norge/comments/vksb5/norphone_mitt_forslag_til_en_norsk_soundex_vel/
         # modified, where necessary to match the "not implemented" rules
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.phonetic.SfinxBis
 """
 
+import pickle  # noqa: S403
 import unittest
 
 from abydos.phonetic import SfinxBis
@@ -255,10 +256,38 @@ class SfinxBisTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('schul'), '#4')
         self.assertEqual(self.pa.encode('skil'), '#4')
 
+        # interacting försvenskning rules
+        self.assertEqual(self.pa.encode('Schiele'), '#4')
+        self.assertEqual(self.pa.encode('Phieler'), 'F246')
+        self.assertEqual(self.pa.encode('Hiort'), 'J63')
+        self.assertEqual(self.pa.encode('Quist'), 'K783')
+        self.assertEqual(self.pa.encode('Stiernhielm'), '#65245')
+        self.assertEqual(self.pa.encode('Thorþórsson'), 'T63685')
+
         # max_length bounds tests
         self.assertEqual(SfinxBis(max_length=-1).encode('Niall'), 'N4')
         self.assertEqual(SfinxBis(max_length=0).encode('Niall'), 'N4')
 
+        # instances survive pickling, and the shared encode cache keeps codes
+        # of different lengths apart
+        pa = pickle.loads(pickle.dumps(SfinxBis(4)))  # noqa: S301
+        self.assertEqual(pa.encode('Christopher'), 'K683')
+        self.assertEqual(SfinxBis().encode('Christopher'), 'K68376')
+        self.assertEqual(pa.encode('Christopher'), 'K683')
+
+        # decomposed input is composed (NFC) before encoding
+        self.assertEqual(self.pa.encode('Sjo\u0308berg'), '#162')
+        self.assertEqual(self.pa.encode('A\u030ahlund'), '$453')
+
+        # encode_batch
+        self.assertEqual(self.pa.encode_batch([]), [])
+        self.assertEqual(
+            self.pa4.encode_batch(
+                iter(['Christopher', 'Smith', 'Christopher'])
+            ),
+            ['K683', 'S53', 'K683'],
+        )
+
         # encode_alpha
         self.assertEqual(
             self.pa.encode_alpha('Stael von Holstein'), 'STL,HLSTKN'